@@ -1,23 +1,51 @@
+import atexit
+import functools
+import os
+import queue
 import yaml
 import logging
 import sys
 
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict, Any
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("dashboard.log"), logging.StreamHandler(sys.stdout)],
-)
+from dotenv import load_dotenv
+
+# 환경 변수와 로깅은 이 모듈에서 한 번만 설정하고, 다른 모듈은 root 핸들러를 그대로 사용
+load_dotenv()
+
+# 로깅 설정: 이벤트 루프 스레드는 큐에 레코드만 넣고,
+# 파일/콘솔 쓰기는 QueueListener의 백그라운드 스레드에서 처리
+if not logging.getLogger().handlers:
+    log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler("dashboard.log")
+    file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, file_handler, stream_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)  # 종료 시 남은 로그를 모두 기록
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
 
-# 구성 파일 로드
+# 구성 파일 로드 (같은 경로는 한 번만 파싱하고 캐시된 dict를 공유하므로 호출자는 수정하지 말 것)
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
+    return _load_config(os.path.realpath(config_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(config_path: str) -> Dict[str, Any]:
     try:
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
+        # libyaml이 설치되어 있으면 C 파서를 사용 (SafeLoader와 동일한 동작)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(config_path, "rb") as file:
+            config = yaml.load(file, Loader=loader)
         logger.info("Configuration loaded successfully.")
         return config
     except FileNotFoundError:
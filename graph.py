@@ -1,10 +1,13 @@
 import asyncio
+import functools
 import aiohttp
+import orjson
 import yaml
 import logging
 import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, Tuple
 from rich.table import Table
 from rich.live import Live
 from rich.console import Console
@@ -14,7 +17,6 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.align import Align
 import click
-import plotille
 from config import load_config
 
 from config import (
@@ -25,48 +27,75 @@ from config import (
     DEFAULT_GRAPH_TIMEFRAMES,
 )
 
-from dotenv import load_dotenv
-load_dotenv()
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("dashboard.log"), logging.StreamHandler(sys.stdout)],
-)
 logger = logging.getLogger(__name__)
 
 UPBIT_API_URL: str = "https://api.upbit.com/v1/"
+# 모든 session.get에 지정하는 요청별 타임아웃 (세션 타임아웃을 대체함)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=2, sock_connect=2, sock_read=3)
+SESSION_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# 캔들에서 종가를 꺼내는 getter (map과 함께 C 레벨에서 반복)
+TRADE_PRICE = itemgetter("trade_price")
+
+# 테이블 컬럼/스타일은 고정값이므로 모듈 로드 시 한 번만 계산
+COLUMN_SPECS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (column["name"], column.get("style", "dim"), column.get("justify", "left"))
+    for column in DEFAULT_GRAPH_COLUMNS
+)
+TABLE_BOX = box.MINIMAL_DOUBLE_HEAD
+TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+NUMBER_TYPES = (int, float)
+# 변동률 표시 템플릿 (상승: 초록, 하락: 빨강)
+POSITIVE_CHANGE_FMT: str = "[green dim]{:.2f}%[/green dim]"
+NEGATIVE_CHANGE_FMT: str = "[red dim]{:.2f}%[/red dim]"
 
 
-# Upbit API에서 데이터 fetching
-async def fetch_ticker(
-    session: aiohttp.ClientSession, symbol: str
-) -> Optional[Dict[str, Any]]:
-    url = f"{UPBIT_API_URL}ticker?markets={symbol}"
+# 값 포맷팅: 숫자가 아니면 "N/A"
+def fmt_krw(value: Any) -> str:
+    return f"{value:,.0f} KRW" if isinstance(value, NUMBER_TYPES) else "N/A"
+
+
+def fmt_volume(value: Any) -> str:
+    return f"{value:,.2f}" if isinstance(value, NUMBER_TYPES) else "N/A"
+
+
+# 여러 심볼의 티커 데이터를 한 번의 요청으로 fetching
+# (상태 코드, 데이터)를 반환하며, 네트워크 오류나 시간 초과 시 상태 코드는 None
+async def fetch_tickers(
+    session: aiohttp.ClientSession, symbols: List[str]
+) -> Tuple[Optional[int], Optional[List[Dict[str, Any]]]]:
+    markets = ",".join(symbols)
+    url = f"{UPBIT_API_URL}ticker?markets={markets}"
     try:
-        async with session.get(url) as response:
+        async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 if data:
-                    return data[0]
+                    return response.status, data
                 else:
-                    logger.warning(f"{symbol}에 대한 데이터가 반환되지 않았습니다.")
-                    return None
+                    logger.warning(f"{markets}에 대한 데이터가 반환되지 않았습니다.")
+                    return response.status, None
             else:
                 logger.error(
-                    f"{symbol}의 데이터를 가져오지 못했습니다. 상태 코드: {response.status}"
+                    f"{markets}의 데이터를 가져오지 못했습니다. 상태 코드: {response.status}"
                 )
-                return None
+                return response.status, None
     except aiohttp.ClientError as e:
-        logger.error(f"{symbol} 데이터를 가져오는 중 클라이언트 오류 발생: {e}")
-        return None
+        logger.error(f"{markets} 데이터를 가져오는 중 클라이언트 오류 발생: {e}")
+        return None, None
     except asyncio.TimeoutError:
-        logger.error(f"{symbol}의 요청이 시간 초과되었습니다.")
-        return None
+        logger.debug(f"{markets}의 요청이 시간 초과되었습니다.")
+        return None, None
     except Exception as e:
-        logger.error(f"{symbol} 데이터를 가져오는 중 예상치 못한 오류 발생: {e}")
-        return None
+        logger.error(f"{markets} 데이터를 가져오는 중 예상치 못한 오류 발생: {e}")
+        return None, None
+
+
+# Upbit API에서 데이터 fetching
+async def fetch_ticker(
+    session: aiohttp.ClientSession, symbol: str
+) -> Optional[Dict[str, Any]]:
+    _, data = await fetch_tickers(session, [symbol])
+    return data[0] if data else None
 
 
 # Upbit API에서 캔들 데이터 fetching
@@ -75,9 +104,9 @@ async def fetch_candles(
 ) -> Optional[List[Dict[str, Any]]]:
     url = f"{UPBIT_API_URL}candles/minutes/{unit}?market={symbol}&count={count}"
     try:
-        async with session.get(url) as response:
+        async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 if data:
                     return data
                 else:
@@ -96,7 +125,7 @@ async def fetch_candles(
         )
         return None
     except asyncio.TimeoutError:
-        logger.error(
+        logger.debug(
             f"{symbol}, 단위: {unit}의 캔들 데이터 요청이 시간 초과되었습니다."
         )
         return None
@@ -111,9 +140,24 @@ async def fetch_candles(
 async def fetch_all_tickers(
     session: aiohttp.ClientSession, symbols: List[str]
 ) -> List[Optional[Dict[str, Any]]]:
-    tasks = [fetch_ticker(session, symbol) for symbol in symbols]
-    results = await asyncio.gather(*tasks, return_exceptions=False)
-    return results
+    status, data = await fetch_tickers(session, symbols)
+    if data is not None:
+        # 응답 순서가 요청 순서와 다를 수 있으므로 심볼 순서로 정렬
+        by_market = {ticker["market"]: ticker for ticker in data}
+        return [by_market.get(symbol) for symbol in symbols]
+
+    # 잘못된 심볼이 섞이면 Upbit이 요청 전체를 4xx로 거부하므로 심볼별 요청으로 대체
+    # (네트워크 오류나 시간 초과는 같은 호스트에 요청을 더 보내도 나아지지 않으므로 제외)
+    if (
+        status is not None
+        and 400 <= status < 500
+        and status != 429  # 요청 한도 초과 시에는 요청을 늘리지 않음
+        and len(symbols) > 1
+    ):
+        tasks = [fetch_ticker(session, symbol) for symbol in symbols]
+        results = await asyncio.gather(*tasks, return_exceptions=False)
+        return results
+    return [None] * len(symbols)
 
 
 # 모든 심볼과 시간프레임에 대한 캔들 데이터 fetching
@@ -145,20 +189,18 @@ async def fetch_all_candles(
 
 
 # 테이블 생성
-def create_table(tickers: List[Optional[Dict[str, Any]]], table_title: str) -> Table:
+def create_table(
+    tickers: List[Optional[Dict[str, Any]]], table_title: str, now_str: str
+) -> Table:
     table = Table(
-        title=f"{table_title} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        box=box.MINIMAL_DOUBLE_HEAD,
+        title=f"{table_title} - {now_str}",
+        box=TABLE_BOX,
         expand=True,
     )
 
     # 컬럼 추가
-    for column in DEFAULT_GRAPH_COLUMNS:
-        table.add_column(
-            column["name"],
-            style=column.get("style", "dim"),
-            justify=column.get("justify", "left"),
-        )
+    for name, style, justify in COLUMN_SPECS:
+        table.add_column(name, style=style, justify=justify)
 
     # 데이터 추가
     for ticker in tickers:
@@ -173,39 +215,18 @@ def create_table(tickers: List[Optional[Dict[str, Any]]], table_title: str) -> T
             low_price: Any = ticker.get("low_price", "N/A")
 
             # 색상 설정: 변동률에 따라 색상 변경
-            change_color = "green dim" if change_rate >= 0 else "red dim"
-            change_display = f"[{change_color}]{change_rate:.2f}%[/{change_color}]"
-
-            # 값 포맷팅
-            trade_price_str = (
-                f"{trade_price:,.0f} KRW"
-                if isinstance(trade_price, (int, float))
-                else "N/A"
-            )
-            trade_volume_str = (
-                f"{trade_volume:,.2f}"
-                if isinstance(trade_volume, (int, float))
-                else "N/A"
-            )
-            high_price_str = (
-                f"{high_price:,.0f} KRW"
-                if isinstance(high_price, (int, float))
-                else "N/A"
-            )
-            low_price_str = (
-                f"{low_price:,.0f} KRW"
-                if isinstance(low_price, (int, float))
-                else "N/A"
-            )
+            change_display = (
+                POSITIVE_CHANGE_FMT if change_rate >= 0 else NEGATIVE_CHANGE_FMT
+            ).format(change_rate)
 
             # 행 추가
             table.add_row(
                 symbol,
-                trade_price_str,
+                fmt_krw(trade_price),
                 change_display,
-                trade_volume_str,
-                high_price_str,
-                low_price_str,
+                fmt_volume(trade_volume),
+                fmt_krw(high_price),
+                fmt_krw(low_price),
             )
         else:
             # 데이터가 없을 경우
@@ -213,12 +234,11 @@ def create_table(tickers: List[Optional[Dict[str, Any]]], table_title: str) -> T
     return table
 
 
-# plotille을 사용하여 그래프를 문자열로 캡처하는 함수
-def create_plotille_line_chart(
-    prices: List[float], width: int = 60, height: int = 20
-) -> str:
-    if not prices:
-        return "데이터 없음"
+# 크기별로 설정이 끝난 plotille Figure를 재사용 (매 업데이트마다 plot만 교체)
+@functools.lru_cache(maxsize=16)
+def _get_figure(width: int, height: int) -> Any:
+    # plotille은 그래프를 그릴 때만 필요하므로 지연 import
+    import plotille
 
     fig = plotille.Figure()
     fig.width = width
@@ -228,14 +248,30 @@ def create_plotille_line_chart(
     fig.title = "Price Chart"
     fig.color_mode = "byte"
     fig.grid = True
-    fig.plot(list(range(len(prices))), prices, label="Price", lc=1)
     fig.legend = True
+    return fig
+
+
+# plotille을 사용하여 그래프를 문자열로 캡처하는 함수
+def create_plotille_line_chart(
+    prices: List[float], width: int = 60, height: int = 20
+) -> str:
+    if not prices:
+        return "데이터 없음"
+
+    fig = _get_figure(width, height)
+    fig.clear()  # 이전 업데이트의 plot 제거
+    fig.plot(range(len(prices)), prices, label="Price", lc=1)
 
     # 그래프를 문자열로 변환
     plot_output = fig.show(legend=True)
     return plot_output
 
 
+# (심볼, 시간프레임, 너비, 높이) -> (최신 캔들 타임스탬프, 패널)
+_panel_cache: Dict[Tuple[str, str, int, int], Tuple[Optional[int], Panel]] = {}
+
+
 # 그래프 패널 생성
 def create_plot_graph_panel(
     symbol: str,
@@ -244,28 +280,68 @@ def create_plot_graph_panel(
     width: int = 60,
     height: int = 20,
 ) -> Panel:
-    if candles is None:
-        content = "데이터 없음"
-    else:
-        # 종가 추출
-        closing_prices = [candle["trade_price"] for candle in reversed(candles)]
-        content = create_plotille_line_chart(closing_prices, width=width, height=height)
     title = f"{symbol} - {timeframe}"
-    return Panel(Align.left(content), title=title, border_style="blue")
+    if candles is None:
+        return Panel(Align.left("데이터 없음"), title=title, border_style="blue")
+
+    # 최신 캔들의 타임스탬프가 이전과 같으면 그래프를 다시 그리지 않고 재사용
+    # (타임스탬프가 없으면 변경 여부를 알 수 없으므로 항상 다시 그림)
+    cache_key = (symbol, timeframe, width, height)
+    latest_timestamp = candles[0].get("timestamp")
+    cached = _panel_cache.get(cache_key)
+    if (
+        latest_timestamp is not None
+        and cached is not None
+        and cached[0] == latest_timestamp
+    ):
+        return cached[1]
+
+    # 종가 추출
+    closing_prices = list(map(TRADE_PRICE, reversed(candles)))
+    content = create_plotille_line_chart(closing_prices, width=width, height=height)
+    panel = Panel(Align.left(content), title=title, border_style="blue")
+    _panel_cache[cache_key] = (latest_timestamp, panel)
+    return panel
 
 
 # 그래프들 생성
 def create_graphs(
     candle_data: Dict[str, Dict[str, Optional[List[Dict[str, Any]]]]]
-) -> List[Panel]:
-    panels = []
+) -> Dict[Tuple[str, str], Panel]:
+    panels = {}
     for symbol, timeframes in candle_data.items():
         for timeframe, candles in timeframes.items():
-            panel = create_plot_graph_panel(symbol, timeframe, candles)
-            panels.append(panel)
+            panels[(symbol, timeframe)] = create_plot_graph_panel(
+                symbol, timeframe, candles
+            )
     return panels
 
 
+# 그래프 레이아웃 생성: 패널 구성은 실행 중 바뀌지 않으므로 한 번만 만들고
+# (심볼, 시간프레임)별 leaf 레이아웃을 반환하여 매 업데이트마다 내용만 교체
+def create_graph_layout(
+    graph_layout: Layout,
+    symbols: List[str],
+    timeframes: List[Dict[str, Any]],
+    columns_per_row: int = 1,
+) -> Dict[Tuple[str, str], Layout]:
+    leaves = {
+        (symbol, timeframe["name"]): Layout()
+        for symbol in symbols
+        for timeframe in timeframes
+    }
+    keys = list(leaves)
+
+    # columns_per_row개씩 한 행에 배치하고, 행들은 세로로 쌓음
+    rows = []
+    for i in range(0, len(keys), columns_per_row):
+        row = Layout()
+        row.split_row(*(leaves[key] for key in keys[i : i + columns_per_row]))
+        rows.append(row)
+    graph_layout.split_column(*rows)
+    return leaves
+
+
 # 메인 루프
 async def run_dashboard(
     symbols: List[str],
@@ -284,45 +360,72 @@ async def run_dashboard(
         Layout(name="table", ratio=2), Layout(name="graphs", ratio=3)
     )
 
+    table_layout = layout["upper"]["table"]
+    footer_layout = layout["lower"]
+    # 한 행에 몇 개의 그래프를 배치할지 조정 (터미널 너비에 따라 조정)
+    graph_leaves = create_graph_layout(
+        layout["upper"]["graphs"], symbols, timeframes, columns_per_row=1
+    )
+
+    # 커넥션을 길게 유지하여 업데이트마다 TCP/TLS 연결을 새로 맺지 않도록 설정.
+    # 한 번의 업데이트에서 보내는 요청(티커 1 + 캔들 심볼×시간프레임)이 모두 동시에
+    # 연결을 얻을 수 있어야 풀 대기 시간이 connect 타임아웃을 소모하지 않음
+    requests_per_tick = 1 + len(symbols) * len(timeframes)
+    connector = aiohttp.TCPConnector(
+        limit=max(32, requests_per_tick),
+        limit_per_host=requests_per_tick,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+
     async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=10)
+        connector=connector, timeout=SESSION_TIMEOUT
     ) as session:
         with Live(layout, console=console, refresh_per_second=1):
+            last_ticker_hash: Optional[int] = None
             while True:
-                # 티커 데이터 가져오기
-                tickers_data = await fetch_all_tickers(session, symbols)
-                table = create_table(tickers_data, table_title)
-
-                # 캔들 데이터 가져오기
-                candle_data = await fetch_all_candles(session, symbols, timeframes)
+                # 티커 데이터와 캔들 데이터를 동시에 가져오기
+                tickers_data, candle_data = await asyncio.gather(
+                    fetch_all_tickers(session, symbols),
+                    fetch_all_candles(session, symbols, timeframes),
+                )
+                # 테이블 제목과 하단 표시줄이 같은 시각을 쓰도록 한 번만 계산
+                now_str = datetime.now().strftime(TIME_FORMAT)
                 graphs = create_graphs(candle_data)
 
-                # 레이아웃 업데이트
-                layout["upper"]["table"].update(table)
-
-                # 그래프를 열로 배열
-                graph_columns = []
-                columns_per_row = 1  # 한 행에 몇 개의 그래프를 배치할지 조정 (터미널 너비에 따라 조정)
-
-                for i in range(0, len(graphs), columns_per_row):
-                    graph_slice = graphs[i : i + columns_per_row]
-                    graph_columns.append(graph_slice)
-
-                graph_layout = Layout()
-                for graph_row in graph_columns:
-                    graph_layout_split = Layout()
-                    for panel in graph_row:
-                        graph_layout_split.split_column(Layout(panel))
-                    graph_layout.split_row(*graph_layout_split.children)
+                # 테이블에 표시되는 시세가 이전과 같으면 테이블을 다시 만들지 않음
+                # (고가/저가는 체결가가 바뀔 때만 바뀌므로 키에서 제외,
+                #  이 경우 테이블 제목의 시각은 마지막으로 시세가 바뀐 시각)
+                ticker_hash = hash(
+                    tuple(
+                        (
+                            (
+                                ticker.get("market"),
+                                ticker.get("trade_price"),
+                                ticker.get("signed_change_rate"),
+                                ticker.get("trade_volume"),
+                            )
+                            if ticker
+                            else None
+                        )
+                        for ticker in tickers_data
+                    )
+                )
+                if ticker_hash != last_ticker_hash:
+                    last_ticker_hash = ticker_hash
+                    table_layout.update(
+                        create_table(tickers_data, table_title, now_str)
+                    )
 
-                layout["upper"]["graphs"].update(graph_layout)
+                # 레이아웃 업데이트: 트리는 그대로 두고 내용만 교체
+                for key, panel in graphs.items():
+                    graph_leaves[key].update(panel)
 
                 # 하단 레이아웃 업데이트 (예: 마지막 업데이트 시간)
-                last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 footer_text = Text(
-                    f"Last Update: {last_update} | Press Ctrl+C to exit.", style="dim"
+                    f"Last Update: {now_str} | Press Ctrl+C to exit.", style="dim"
                 )
-                layout["lower"].update(Align.center(footer_text))
+                footer_layout.update(Align.center(footer_text))
 
                 await asyncio.sleep(update_interval)
 
@@ -1,9 +1,9 @@
 import asyncio
 import aiohttp
+import orjson
 import logging
-import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from rich.table import Table
 from rich.live import Live
 from rich.console import Console
@@ -15,76 +15,111 @@ from config import (
     DEFAULT_PRICE_COLUMNS,
 )
 
-from dotenv import load_dotenv
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("dashboard.log"), logging.StreamHandler(sys.stdout)],
+UPBIT_API_URL: str = "https://api.upbit.com/v1/"
+# 모든 session.get에 지정하는 요청별 타임아웃 (세션 타임아웃을 대체함)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=2, sock_connect=2, sock_read=3)
+SESSION_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 테이블 컬럼/스타일은 고정값이므로 모듈 로드 시 한 번만 계산
+COLUMN_SPECS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (column["name"], column.get("style", "dim"), column.get("justify", "left"))
+    for column in DEFAULT_PRICE_COLUMNS
 )
-logger = logging.getLogger(__name__)
+TABLE_BOX = box.MINIMAL_DOUBLE_HEAD
+TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+NUMBER_TYPES = (int, float)
+# 변동률 표시 템플릿 (상승: 초록, 하락: 빨강)
+POSITIVE_CHANGE_FMT: str = "[green dim]{:.2f}%[/green dim]"
+NEGATIVE_CHANGE_FMT: str = "[red dim]{:.2f}%[/red dim]"
 
 
-UPBIT_API_URL: str = "https://api.upbit.com/v1/"
+# 값 포맷팅: 숫자가 아니면 "N/A"
+def fmt_krw(value: Any) -> str:
+    return f"{value:,.0f} KRW" if isinstance(value, NUMBER_TYPES) else "N/A"
 
 
-# Upbit API에서 데이터 fetching
-async def fetch_ticker(
-    session: aiohttp.ClientSession, symbol: str
-) -> Optional[Dict[str, Any]]:
-    url = f"{UPBIT_API_URL}ticker?markets={symbol}"
+def fmt_volume(value: Any) -> str:
+    return f"{value:,.2f}" if isinstance(value, NUMBER_TYPES) else "N/A"
+
+
+# 여러 심볼의 데이터를 한 번의 요청으로 fetching
+# (상태 코드, 데이터)를 반환하며, 네트워크 오류나 시간 초과 시 상태 코드는 None
+async def fetch_tickers(
+    session: aiohttp.ClientSession, symbols: List[str]
+) -> Tuple[Optional[int], Optional[List[Dict[str, Any]]]]:
+    markets = ",".join(symbols)
+    url = f"{UPBIT_API_URL}ticker?markets={markets}"
     try:
-        async with session.get(url) as response:
+        async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 if data:
-                    return data[0]
+                    return response.status, data
                 else:
-                    logger.warning(f"No data returned for symbol: {symbol}")
-                    return None
+                    logger.warning(f"No data returned for symbols: {markets}")
+                    return response.status, None
             else:
                 logger.error(
-                    f"Failed to fetch data for {symbol}. Status Code: {response.status}"
+                    f"Failed to fetch data for {markets}. Status Code: {response.status}"
                 )
-                return None
+                return response.status, None
     except aiohttp.ClientError as e:
-        logger.error(f"Client error while fetching data for {symbol}: {e}")
-        return None
+        logger.error(f"Client error while fetching data for {markets}: {e}")
+        return None, None
     except asyncio.TimeoutError:
-        logger.error(f"Request timed out for symbol: {symbol}")
-        return None
+        logger.debug(f"Request timed out for symbols: {markets}")
+        return None, None
     except Exception as e:
-        logger.error(f"Unexpected error while fetching data for {symbol}: {e}")
-        return None
+        logger.error(f"Unexpected error while fetching data for {markets}: {e}")
+        return None, None
+
+
+# Upbit API에서 데이터 fetching
+async def fetch_ticker(
+    session: aiohttp.ClientSession, symbol: str
+) -> Optional[Dict[str, Any]]:
+    _, data = await fetch_tickers(session, [symbol])
+    return data[0] if data else None
 
 
 # 모든 심볼에 대해 데이터 fetching
-async def fetch_all_tickers(symbols: List[str]) -> List[Optional[Dict[str, Any]]]:
-    timeout = aiohttp.ClientTimeout(total=10)  # 전체 요청 타임아웃 설정
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+async def fetch_all_tickers(
+    session: aiohttp.ClientSession, symbols: List[str]
+) -> List[Optional[Dict[str, Any]]]:
+    status, data = await fetch_tickers(session, symbols)
+    if data is not None:
+        # 응답 순서가 요청 순서와 다를 수 있으므로 심볼 순서로 정렬
+        by_market = {ticker["market"]: ticker for ticker in data}
+        return [by_market.get(symbol) for symbol in symbols]
+
+    # 잘못된 심볼이 섞이면 Upbit이 요청 전체를 4xx로 거부하므로 심볼별 요청으로 대체
+    # (네트워크 오류나 시간 초과는 같은 호스트에 요청을 더 보내도 나아지지 않으므로 제외)
+    if (
+        status is not None
+        and 400 <= status < 500
+        and status != 429  # 요청 한도 초과 시에는 요청을 늘리지 않음
+        and len(symbols) > 1
+    ):
         tasks = [fetch_ticker(session, symbol) for symbol in symbols]
         results = await asyncio.gather(*tasks, return_exceptions=False)
         return results
+    return [None] * len(symbols)
 
 
 # 테이블 생성
 def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
     table = Table(
-        title=f"{DEFAULT_PRICE_TABLE_TITLE} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        box=box.MINIMAL_DOUBLE_HEAD,
+        title=f"{DEFAULT_PRICE_TABLE_TITLE} - {datetime.now().strftime(TIME_FORMAT)}",
+        box=TABLE_BOX,
         expand=True,
     )
 
     # 컬럼 추가
-    for column in DEFAULT_PRICE_COLUMNS:
-        table.add_column(
-            column["name"],
-            style=column.get("style", "dim"),
-            justify=column.get("justify", "left"),
-        )
+    for name, style, justify in COLUMN_SPECS:
+        table.add_column(name, style=style, justify=justify)
 
     # 데이터 추가
     for ticker in tickers:
@@ -99,39 +134,18 @@ def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
             low_price: Any = ticker.get("low_price", "N/A")
 
             # 색상 설정: 변동률에 따라 색상 변경
-            change_color = "green dim" if change_rate >= 0 else "red dim"
-            change_display = f"[{change_color}]{change_rate:.2f}%[/{change_color}]"
-
-            # 값 포맷팅
-            trade_price_str = (
-                f"{trade_price:,.0f} KRW"
-                if isinstance(trade_price, (int, float))
-                else "N/A"
-            )
-            trade_volume_str = (
-                f"{trade_volume:,.2f}"
-                if isinstance(trade_volume, (int, float))
-                else "N/A"
-            )
-            high_price_str = (
-                f"{high_price:,.0f} KRW"
-                if isinstance(high_price, (int, float))
-                else "N/A"
-            )
-            low_price_str = (
-                f"{low_price:,.0f} KRW"
-                if isinstance(low_price, (int, float))
-                else "N/A"
-            )
+            change_display = (
+                POSITIVE_CHANGE_FMT if change_rate >= 0 else NEGATIVE_CHANGE_FMT
+            ).format(change_rate)
 
             # 행 추가
             table.add_row(
                 symbol,
-                trade_price_str,
+                fmt_krw(trade_price),
                 change_display,
-                trade_volume_str,
-                high_price_str,
-                low_price_str,
+                fmt_volume(trade_volume),
+                fmt_krw(high_price),
+                fmt_krw(low_price),
             )
         else:
             # 데이터가 없을 경우
@@ -142,12 +156,14 @@ def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
 # 메인 루프
 async def main():
     console = Console()
-    with Live(console=console, refresh_per_second=1) as live:
-        while True:
-            tickers_data = await fetch_all_tickers(DEFAULT_PRICE_SYMBOLS)
-            table = create_table(tickers_data)
-            live.update(table)
-            await asyncio.sleep(DEFAULT_PRICE_UPDATE_INTERVAL)
+    # 세션을 루프 밖에서 한 번만 생성하여 업데이트마다 연결을 재사용
+    async with aiohttp.ClientSession(timeout=SESSION_TIMEOUT) as session:
+        with Live(console=console, refresh_per_second=1) as live:
+            while True:
+                tickers_data = await fetch_all_tickers(session, DEFAULT_PRICE_SYMBOLS)
+                table = create_table(tickers_data)
+                live.update(table)
+                await asyncio.sleep(DEFAULT_PRICE_UPDATE_INTERVAL)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 import asyncio
+import aiohttp
+import orjson
 import logging
-import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-import yfinance as yf
 from rich.table import Table
 from rich.live import Live
 from rich.console import Console
@@ -16,39 +16,69 @@ from config import (
     DEFAULT_STOCK_PRICE_COLUMNS
 )
 
-from dotenv import load_dotenv
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+YAHOO_CHART_API_URL: str = "https://query1.finance.yahoo.com/v8/finance/chart/"
+YAHOO_QUOTE_API_URL: str = "https://query1.finance.yahoo.com/v7/finance/quote"
+# Yahoo는 User-Agent가 없는 요청을 거부하므로 브라우저 헤더를 지정
+YAHOO_HEADERS: Dict[str, str] = {"User-Agent": "Mozilla/5.0"}
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("dashboard.log"), logging.StreamHandler(sys.stdout)],
+# 테이블 컬럼/스타일은 고정값이므로 모듈 로드 시 한 번만 계산
+COLUMN_SPECS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (column["name"], column.get("style", "dim"), column.get("justify", "left"))
+    for column in DEFAULT_STOCK_PRICE_COLUMNS
 )
-logger = logging.getLogger(__name__)
+TABLE_BOX = box.MINIMAL_DOUBLE_HEAD
+TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+NUMBER_TYPES = (int, float)
+# 변동률 표시 템플릿 (상승: 초록, 하락: 빨강)
+POSITIVE_CHANGE_FMT: str = "[green dim]{:.2f}%[/green dim]"
+NEGATIVE_CHANGE_FMT: str = "[red dim]{:.2f}%[/red dim]"
+
+
+def fmt_price(value: Any) -> str:
+    return f"{value:,.2f}" if isinstance(value, NUMBER_TYPES) else "N/A"
 
 
-async def fetch_ticker(symbol: str) -> Optional[Dict[str, Any]]:
-    """yfinance를 통해 심볼의 최근 일자 주가를 가져온다."""
+def fmt_volume(value: Any) -> str:
+    return f"{value:,.0f}" if isinstance(value, NUMBER_TYPES) else "N/A"
+
+
+async def fetch_ticker(
+    session: aiohttp.ClientSession, symbol: str
+) -> Optional[Dict[str, Any]]:
+    """Yahoo chart API를 통해 심볼의 최근 일자 주가를 가져온다."""
+    # ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y'
+    url = f"{YAHOO_CHART_API_URL}{symbol}?range=5d&interval=1d"
     try:
-        # yfinance는 동기적이므로 to_thread로 비동기 래핑 
-        # ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y'
-        data = await asyncio.to_thread(yf.Ticker(symbol).history, period="5d", interval="1d")
-        if data.empty:
+        async with session.get(url) as response:
+            if response.status != 200:
+                logger.error(
+                    f"Failed to fetch data for {symbol}. Status Code: {response.status}"
+                )
+                return None
+            data = orjson.loads(await response.read())
+
+        results = (data.get("chart") or {}).get("result")
+        if not results:
             logger.warning(f"No data returned for symbol: {symbol}")
             return None
-        
-        # 최근 행(마지막 분봉 또는 종가)에서 종가, 고가, 저가, 거래량
-        last_row = data.iloc[-1]        
-        yesterday_price = last_row["Open"]
-        today_price = last_row["Close"]
-        high_price = last_row["High"]
-        low_price = last_row["Low"]
-        volume = last_row["Volume"]
-        
+
+        # 최근 행(마지막 일봉)에서 시가, 종가, 고가, 저가, 거래량
+        quote = results[0]["indicators"]["quote"][0]
+        yesterday_price = quote["open"][-1]
+        today_price = quote["close"][-1]
+        high_price = quote["high"][-1]
+        low_price = quote["low"][-1]
+        volume = quote["volume"][-1]
+
+        if yesterday_price is None or today_price is None:
+            logger.warning(f"No price returned for symbol: {symbol}")
+            return None
+
         # 변동률 계산: (금일종가 - 금일시가) / 금일시가 * 100
         change_rate = ((today_price - yesterday_price) / yesterday_price) * 100
-        
 
         return {
             "symbol": symbol,
@@ -59,31 +89,141 @@ async def fetch_ticker(symbol: str) -> Optional[Dict[str, Any]]:
             "high": high_price,
             "low": low_price,
         }
+    except aiohttp.ClientError as e:
+        logger.error(f"Client error while fetching data for {symbol}: {e}")
+        return None
+    except asyncio.TimeoutError:
+        logger.error(f"Request timed out for symbol: {symbol}")
+        return None
     except Exception as e:
         logger.error(f"Error fetching data for {symbol}: {e}")
         return None
 
 
-async def fetch_all_tickers(symbols: List[str]) -> List[Optional[Dict[str, Any]]]:
-    tasks = [fetch_ticker(symbol) for symbol in symbols]
-    results = await asyncio.gather(*tasks, return_exceptions=False)
+# quote API는 crumb/쿠키 없이 401/403으로 거부되는 경우가 많으므로, 한 번 거부되면
+# 프로세스가 끝날 때까지 (main()은 세션을 하나만 사용) chart API만 사용
+_quote_api_rejected: bool = False
+
+
+async def fetch_quotes(
+    session: aiohttp.ClientSession, symbols: List[str]
+) -> Tuple[Optional[int], Optional[List[Dict[str, Any]]]]:
+    """Yahoo quote API를 통해 여러 심볼의 시세를 한 번의 요청으로 가져온다.
+
+    (상태 코드, 시세 목록)을 반환하며, 네트워크 오류나 시간 초과 시 상태 코드는 None.
+    """
+    global _quote_api_rejected
+
+    joined = ",".join(symbols)
+    url = f"{YAHOO_QUOTE_API_URL}?symbols={joined}"
+    try:
+        async with session.get(url) as response:
+            if response.status in (401, 403):
+                _quote_api_rejected = True
+                logger.warning(
+                    "Yahoo quote API rejected the request "
+                    f"(Status Code: {response.status}). "
+                    "Falling back to per-symbol chart requests."
+                )
+                return response.status, None
+            if response.status != 200:
+                logger.error(
+                    f"Failed to fetch quotes for {joined}. Status Code: {response.status}"
+                )
+                return response.status, None
+            data = orjson.loads(await response.read())
+
+        results = (data.get("quoteResponse") or {}).get("result")
+        if not results:
+            logger.warning(f"No quotes returned for symbols: {joined}")
+            return response.status, None
+        return response.status, results
+    except aiohttp.ClientError as e:
+        logger.error(f"Client error while fetching quotes for {joined}: {e}")
+        return None, None
+    except asyncio.TimeoutError:
+        logger.error(f"Request timed out for symbols: {joined}")
+        return None, None
+    except Exception as e:
+        logger.error(f"Error fetching quotes for {joined}: {e}")
+        return None, None
+
+
+def parse_quote(quote: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """quote API 응답 한 건을 fetch_ticker와 같은 형태의 dict로 변환한다."""
+    yesterday_price = quote.get("regularMarketOpen")
+    today_price = quote.get("regularMarketPrice")
+    if not yesterday_price or today_price is None:
+        # 장 시작 전 등 시가가 없는 경우
+        return None
+
+    # 변동률 계산: fetch_ticker와 동일하게 (금일종가 - 금일시가) / 금일시가 * 100
+    change_rate = ((today_price - yesterday_price) / yesterday_price) * 100
+
+    return {
+        "symbol": quote.get("symbol"),
+        "yesterday": yesterday_price,
+        "today": today_price,
+        "change_rate": change_rate,
+        "volume": quote.get("regularMarketVolume"),
+        "high": quote.get("regularMarketDayHigh"),
+        "low": quote.get("regularMarketDayLow"),
+    }
+
+
+async def fetch_all_tickers(
+    session: aiohttp.ClientSession, symbols: List[str]
+) -> List[Optional[Dict[str, Any]]]:
+    if _quote_api_rejected:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(symbols)
+    else:
+        status, quotes = await fetch_quotes(session, symbols)
+        if quotes is None and (status is None or status == 429 or status >= 500):
+            # 네트워크 오류, 시간 초과, 요청 한도 초과, 서버 오류는
+            # 같은 호스트에 요청을 더 보내도 나아지지 않으므로 대체하지 않음
+            return [None] * len(symbols)
+
+        # 응답 순서가 요청 순서와 다를 수 있고 Yahoo는 심볼을 대문자로 반환하므로
+        # 대문자 심볼 기준으로 요청 순서에 맞춰 정렬
+        by_symbol = {
+            str(quote.get("symbol", "")).upper(): quote for quote in quotes or []
+        }
+        results = [
+            (
+                parse_quote(by_symbol[symbol.upper()])
+                if symbol.upper() in by_symbol
+                else None
+            )
+            for symbol in symbols
+        ]
+
+    # quote API가 거부되었거나, 응답에 없거나 파싱하지 못한 심볼은 chart API로 대체
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        if not _quote_api_rejected:
+            logger.debug(
+                "Falling back to chart API for symbols: "
+                f"{', '.join(symbols[i] for i in missing)}"
+            )
+        fallback = await asyncio.gather(
+            *(fetch_ticker(session, symbols[i]) for i in missing),
+            return_exceptions=False,
+        )
+        for i, result in zip(missing, fallback):
+            results[i] = result
     return results
 
 
 def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
     table = Table(
-        title=f"{DEFAULT_STOCK_PRICE_TABLE_TITLE} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        box=box.MINIMAL_DOUBLE_HEAD,
+        title=f"{DEFAULT_STOCK_PRICE_TABLE_TITLE} - {datetime.now().strftime(TIME_FORMAT)}",
+        box=TABLE_BOX,
         expand=True,
     )
 
     # 컬럼 추가
-    for column in DEFAULT_STOCK_PRICE_COLUMNS:
-        table.add_column(
-            column["name"],
-            style=column.get("style", "dim"),
-            justify=column.get("justify", "left"),
-        )
+    for name, style, justify in COLUMN_SPECS:
+        table.add_column(name, style=style, justify=justify)
 
     for ticker in tickers:
         if ticker:
@@ -95,39 +235,18 @@ def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
             high_price = ticker.get("high", "N/A")
             low_price = ticker.get("low", "N/A")
 
-            change_color = "green dim" if change_rate >= 0 else "red dim"
-            change_display = f"[{change_color}]{change_rate:.2f}%[/{change_color}]"
-
-            yesterday_price_str = (
-                f"{yesterday_price:,.2f}" if isinstance(yesterday_price, (int, float)) else "N/A"
-            )
-            today_price_str = (
-                f"{today_price:,.2f}" if isinstance(today_price, (int, float)) else "N/A"
-            )
-            volume_str = (
-                f"{volume:,.0f}"
-                if isinstance(volume, (int, float))
-                else "N/A"
-            )
-            high_price_str = (
-                f"{high_price:,.2f}"
-                if isinstance(high_price, (int, float))
-                else "N/A"
-            )
-            low_price_str = (
-                f"{low_price:,.2f}"
-                if isinstance(low_price, (int, float))
-                else "N/A"
-            )
+            change_display = (
+                POSITIVE_CHANGE_FMT if change_rate >= 0 else NEGATIVE_CHANGE_FMT
+            ).format(change_rate)
 
             table.add_row(
                 symbol,
-                yesterday_price_str,
-                today_price_str,
+                fmt_price(yesterday_price),
+                fmt_price(today_price),
                 change_display,
-                volume_str,
-                high_price_str,
-                low_price_str,
+                fmt_volume(volume),
+                fmt_price(high_price),
+                fmt_price(low_price),
             )
         else:
             # 데이터가 없을 경우
@@ -137,12 +256,17 @@ def create_table(tickers: List[Optional[Dict[str, Any]]]) -> Table:
 
 async def main():
     console = Console()
-    with Live(console=console, refresh_per_second=1) as live:
-        while True:
-            tickers_data = await fetch_all_tickers(DEFAULT_STOCK_PRICE_SYMBOLS)
-            table = create_table(tickers_data)
-            live.update(table)
-            await asyncio.sleep(DEFAULT_STOCK_PRICE_UPDATE_INTERVAL)
+    timeout = aiohttp.ClientTimeout(total=10)  # 전체 요청 타임아웃 설정
+    # 세션을 루프 밖에서 한 번만 생성하여 업데이트마다 연결을 재사용
+    async with aiohttp.ClientSession(timeout=timeout, headers=YAHOO_HEADERS) as session:
+        with Live(console=console, refresh_per_second=1) as live:
+            while True:
+                tickers_data = await fetch_all_tickers(
+                    session, DEFAULT_STOCK_PRICE_SYMBOLS
+                )
+                table = create_table(tickers_data)
+                live.update(table)
+                await asyncio.sleep(DEFAULT_STOCK_PRICE_UPDATE_INTERVAL)
 
 
 if __name__ == "__main__":